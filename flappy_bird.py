@@ -5,7 +5,21 @@ import random
 import math
 from typing import List, Dict, Tuple, Optional
 
+# Sine lookup table for enemy motion (size must be a power of two for masking)
+SIN_TABLE_SIZE = 4096
+SIN_TABLE = [math.sin(2 * math.pi * i / SIN_TABLE_SIZE) for i in range(SIN_TABLE_SIZE)]
+
+def random_int(low: int, high: int) -> int:
+    # Same range as random.randint(low, high), without its argument checking
+    return low + int(random.random() * (high - low + 1))
+
 class GameObject:
+    __slots__ = ('rect', 'x', 'y', 'width', 'height')
+
+    # Column capital/base size and the width of the line that trims them
+    segment_height = 20
+    segment_line_width = 3
+
     def __init__(self, x: float, y: float, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.x = float(x)
@@ -13,6 +27,14 @@ class GameObject:
         self.width = width
         self.height = height
 
+    def reset(self, x: float, y: float, width: int, height: int):
+        # Reposition a pooled object without allocating a new Rect
+        self.rect.update(x, y, width, height)
+        self.x = float(x)
+        self.y = float(y)
+        self.width = width
+        self.height = height
+
     def draw(self, screen: pygame.Surface, image: Optional[pygame.Surface] = None):
         if image:
             screen.blit(image, self.rect)
@@ -22,7 +44,7 @@ class GameObject:
             
             # Add column details
             pillar_width = self.rect.width
-            segment_height = 20
+            segment_height = self.segment_height
             
             # Draw top capital
             if self.rect.height > segment_height:
@@ -31,7 +53,7 @@ class GameObject:
                 pygame.draw.line(screen, (180, 160, 130), 
                                (self.rect.x, self.rect.y + segment_height),
                                (self.rect.x + pillar_width, self.rect.y + segment_height),
-                               3)
+                               self.segment_line_width)
             
             # Draw base
             if self.rect.height > segment_height:
@@ -41,7 +63,7 @@ class GameObject:
                 pygame.draw.line(screen, (180, 160, 130),
                                (self.rect.x, self.rect.bottom - segment_height),
                                (self.rect.x + pillar_width, self.rect.bottom - segment_height),
-                               3)
+                               self.segment_line_width)
             
             # Draw vertical grooves
             groove_count = 3
@@ -53,6 +75,8 @@ class GameObject:
                                2)
 
 class Player(GameObject):
+    __slots__ = ('velocity', 'gravity', 'flap_strength', 'max_velocity')
+
     def __init__(self, x: float, y: float, config: Dict):
         super().__init__(x, y, config['width'], config['height'])
         self.velocity = 0
@@ -61,50 +85,104 @@ class Player(GameObject):
         self.max_velocity = config['max_velocity']
 
     def update(self):
-        self.velocity = min(self.velocity + self.gravity, self.max_velocity)
-        self.y += self.velocity
+        # Keep the float position, gravity needs sub-pixel accumulation
+        velocity = min(self.velocity + self.gravity, self.max_velocity)
+        self.velocity = velocity
+        self.y += velocity
         self.rect.y = int(self.y)
 
     def flap(self):
         self.velocity = self.flap_strength
 
 class Wall(GameObject):
+    __slots__ = ('speed',)
+
+    # Rows at each end of the column that hold the capital/base: the segment, the half
+    # of its line that overhangs into the body, and one spare row
+    cap_height = GameObject.segment_height + GameObject.segment_line_width // 2 + 1
+
     def __init__(self, x: float, y: float, width: int, height: int, speed: float):
         super().__init__(x, y, width, height)
         self.speed = speed
 
+    def reset(self, x: float, y: float, width: int, height: int, speed: float):
+        super().reset(x, y, width, height)
+        self.speed = speed
+
     def update(self):
         self.x -= self.speed
         self.rect.x = int(self.x)
 
+    def template_blits(self, template: pygame.Surface) -> Optional[List[Tuple]]:
+        # The template can't cover walls that are taller than it or too short for both ends
+        if self.rect.height > template.get_height() or self.rect.height <= 2 * self.cap_height:
+            return None
+
+        # The column body is uniform, so blit the template's top part (capital + body)
+        # and finish with the template's bottom rows (base)
+        template_width = template.get_width()
+        body_height = self.rect.height - self.cap_height
+        return [(template, self.rect.topleft, (0, 0, template_width, body_height)),
+                (template, (self.rect.x, self.rect.y + body_height),
+                 (0, template.get_height() - self.cap_height, template_width, self.cap_height))]
+
 class Projectile(GameObject):
+    __slots__ = ('speed',)
+
+    _sprite: Optional[pygame.Surface] = None
+
     def __init__(self, x: float, y: float, speed: float):
         super().__init__(x, y, 20, 10)  # Small projectile size
         self.speed = speed
     
+    def reset(self, x: float, y: float, speed: float):
+        super().reset(x, y, 20, 10)
+        self.speed = speed
+    
     def update(self):
-        self.x += self.speed
-        self.rect.x = int(self.x)
+        # Projectile speed is a whole number of pixels, so move the rect directly
+        self.rect.x += self.speed
     
+    @classmethod
+    def get_sprite(cls) -> pygame.Surface:
+        # Render the golden projectile once and reuse it for every shot
+        if cls._sprite is None:
+            sprite = pygame.Surface((20, 10), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, (255, 215, 0), sprite.get_rect())  # Gold color
+            cls._sprite = sprite.convert_alpha()
+        return cls._sprite
+
     def draw(self, screen: pygame.Surface):
-        # Draw a golden projectile
-        pygame.draw.ellipse(screen, (255, 215, 0), self.rect)  # Gold color
+        screen.blit(self.get_sprite(), self.rect)
 
 class Enemy(GameObject):
+    __slots__ = ('speed', 'direction', 'amplitude', 'original_y', 'time')
+
     def __init__(self, x: float, y: float, config: Dict, speed_multiplier: float):
         super().__init__(x, y, config['width'], config['height'])
+        self.reset(x, y, config, speed_multiplier)
+
+    def reset(self, x: float, y: float, config: Dict, speed_multiplier: float):
+        super().reset(x, y, config['width'], config['height'])
         self.speed = config['speed'] * speed_multiplier
-        self.direction = random.choice([-1, 1])
+        self.direction = (random.getrandbits(1) << 1) - 1  # -1 or 1
         self.amplitude = 100
         self.original_y = y
         self.time = random.random() * 10
 
-    def update(self):
-        self.x -= self.speed
-        self.time += 0.05
-        self.y = self.original_y + self.amplitude * math.sin(self.time)
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+    @staticmethod
+    def update_all(enemies):
+        # Move every enemy in a single pass rather than one method call each
+        sin_table = SIN_TABLE
+        sin_mask = SIN_TABLE_SIZE - 1
+        sin_scale = SIN_TABLE_SIZE / (2 * math.pi)
+        for enemy in enemies:
+            enemy.x -= enemy.speed
+            enemy.time += 0.05
+            sin_time = sin_table[int(enemy.time * sin_scale) & sin_mask]
+            enemy.y = enemy.original_y + enemy.amplitude * sin_time
+            enemy.rect.x = int(enemy.x)
+            enemy.rect.y = int(enemy.y)
 
 class FlappyBird:
     def __init__(self):
@@ -122,47 +200,92 @@ class FlappyBird:
         pygame.display.set_caption(self.config['window']['title'])
         self.clock = pygame.time.Clock()
         self.fps = self.config['window']['fps']
+        self.menu_fps = 10  # Menus are static, so poll them at a lower rate
+
+        # Profile a fixed number of gameplay frames: FLAPPY_PROFILE=1 python -m scalene flappy_bird.py
+        self.profile_frames = 0
+        if os.environ.get('FLAPPY_PROFILE') == '1':
+            self.profile_frames = int(os.environ.get('FLAPPY_PROFILE_FRAMES', 1800))
 
         # Game state
         self.current_level = 0
         self.score = 0
         self.high_score = self.load_high_score()
         self.game_state = "START"  # START, PLAYING, GAME_OVER
+        self.drawn_state = None  # State shown on screen, used to skip redrawing static menus
+        if self.profile_frames:
+            self.game_state = "PLAYING"  # Skip the menus so every profiled frame is gameplay
         
         # Background scrolling
         self.bg_scroll = 0
         self.bg_scroll_speed = self.config['walls']['speed']  # Match wall speed
         
+        # Game objects
+        self.walls: List[Wall] = []
+        self.enemies: List[Enemy] = []
+        
         # Projectile system
         self.projectiles: List[Projectile] = []
         self.last_shot = 0
         self.shot_cooldown = 500  # Milliseconds between shots
 
+        # Pools of inactive objects, reused instead of allocating new ones
+        self.wall_pool: List[Wall] = []
+        self.enemy_pool: List[Enemy] = []
+        self.projectile_pool: List[Projectile] = []
+
+        # Fonts (loading a font is expensive, so create them once)
+        self.font_small = pygame.font.Font(None, 36)
+        self.font_medium = pygame.font.Font(None, 48)
+        self.font_large = pygame.font.Font(None, 64)
+
+        # Cache the current level's settings
+        self.cache_level_data()
+
         # Load assets
         self.load_assets()
+        self.build_text_surfaces()
 
         # Initialize game objects
         self.reset_game()
 
+    def cache_level_data(self):
+        # Resolve config lookups once per level rather than on every update
+        self.level_data = self.config['levels'][self.current_level]
+        self.wall_config = self.config['walls']
+        self.enemy_config = self.config['enemies']
+        self.wall_speed = self.wall_config['speed'] * self.level_data['wall_speed_multiplier']
+        self.wall_frequency = self.level_data['wall_frequency']
+        self.enemy_spawn_rate = self.enemy_config['spawn_rate']
+        self.enemy_count = self.level_data['enemy_count']
+
     def load_assets(self):
-        level_data = self.config['levels'][self.current_level]
+        level_data = self.level_data
         
         # Load and scale images
-        self.background = pygame.image.load(level_data['assets']['map']).convert()
-        self.background = pygame.transform.scale(self.background, (self.width, self.height))
+        self.background = self.load_image(level_data['assets']['map'], (self.width, self.height), alpha=False)
         
         # Create mirrored background
         self.background_flipped = pygame.transform.flip(self.background, True, False)
+        self._bg_images = (self.background, self.background_flipped)
         
-        self.player_img = pygame.image.load(level_data['assets']['player']).convert_alpha()
-        self.player_img = pygame.transform.scale(self.player_img, 
-                                               (self.config['player']['width'], 
-                                                self.config['player']['height']))
+        # Calculate how many background images we need to fill the screen
+        self._bg_width = self.background.get_width()
+        self._bg_tiles = math.ceil(self.width / self._bg_width) + 2  # Add extra tile for smoother transition
+        
+        self.player_img = self.load_image(level_data['assets']['player'],
+                                          (self.config['player']['width'],
+                                           self.config['player']['height']))
         
-        self.enemy_img = pygame.image.load(level_data['assets']['enemy']).convert_alpha()
-        self.enemy_img = pygame.transform.scale(self.enemy_img,
-                                              (self.config['enemies']['width'],
-                                               self.config['enemies']['height']))
+        self.enemy_img = self.load_image(level_data['assets']['enemy'],
+                                         (self.enemy_config['width'],
+                                          self.enemy_config['height']))
+
+        # Pre-render a full-height column that walls are cut from when drawn
+        # (one pixel wider, as the capital/base lines overhang the right edge)
+        wall_width = self.wall_config['width']
+        self._wall_template = pygame.Surface((wall_width + 1, self.height), pygame.SRCALPHA)
+        GameObject(0, 0, wall_width, self.height).draw(self._wall_template)
 
         # Load sounds with error handling
         self.sounds = {}
@@ -194,6 +317,13 @@ class FlappyBird:
             for sound_name in ['flap', 'enemy', 'gameover']:
                 self.sounds[sound_name] = pygame.mixer.Sound(buffer=bytes(32))  # Empty sound
 
+    def load_image(self, path: str, size: Tuple[int, int], alpha: bool = True) -> pygame.Surface:
+        image = pygame.image.load(path)
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        # Convert after scaling so the final surface matches the display format
+        return image.convert_alpha() if alpha else image.convert()
+
     def load_high_score(self) -> int:
         try:
             with open('highscore.txt', 'r') as f:
@@ -206,19 +336,25 @@ class FlappyBird:
             f.write(str(self.high_score))
 
     def reset_game(self):
-        level_data = self.config['levels'][self.current_level]
+        self.cache_level_data()
         
         # Initialize player
         self.player = Player(self.width // 4, self.height // 2,
                            self.config['player'])
         
+        # Return objects from the previous game to their pools
+        self.wall_pool.extend(self.walls)
+        self.enemy_pool.extend(self.enemies)
+        self.projectile_pool.extend(self.projectiles)
+        
         # Initialize walls and enemies
         self.walls: List[Wall] = []
         self.enemies: List[Enemy] = []
         self.projectiles: List[Projectile] = []
         self.last_wall = 0  # Set to 0 to spawn first wall immediately
-        self.last_enemy = pygame.time.get_ticks()
-        self.last_shot = pygame.time.get_ticks()
+        current_time = pygame.time.get_ticks()
+        self.last_enemy = current_time
+        self.last_shot = current_time
         
         # Create initial wall
         self.create_wall_pair()
@@ -226,54 +362,68 @@ class FlappyBird:
         # Reset score
         self.score = 0
         
-    def shoot_projectile(self):
-        current_time = pygame.time.get_ticks()
+    def shoot_projectile(self, current_time: int):
         if current_time - self.last_shot > self.shot_cooldown:
             # Create projectile at bird's position
-            projectile = Projectile(self.player.rect.right, 
-                                  self.player.rect.centery, 
-                                  10)  # Speed of 10
+            projectile = self.make_projectile(self.player.rect.right, 
+                                              self.player.rect.centery, 
+                                              10)  # Speed of 10
             self.projectiles.append(projectile)
             self.last_shot = current_time
 
+    def make_projectile(self, x: float, y: float, speed: float) -> Projectile:
+        if self.projectile_pool:
+            projectile = self.projectile_pool.pop()
+            projectile.reset(x, y, speed)
+            return projectile
+        return Projectile(x, y, speed)
+
     def create_wall_pair(self):
-        level_data = self.config['levels'][self.current_level]
-        wall_config = self.config['walls']
+        wall_config = self.wall_config
         
-        gap_y = random.randint(wall_config['gap'], self.height - wall_config['gap'])
-        wall_speed = wall_config['speed'] * level_data['wall_speed_multiplier']
+        gap_y = random_int(wall_config['gap'], self.height - wall_config['gap'])
+        wall_speed = self.wall_speed
         
         # Create top and bottom walls
-        top_wall = Wall(self.width, 0, wall_config['width'],
-                       gap_y - wall_config['gap'] // 2, wall_speed)
-        bottom_wall = Wall(self.width, gap_y + wall_config['gap'] // 2,
-                         wall_config['width'],
-                         self.height - (gap_y + wall_config['gap'] // 2),
-                         wall_speed)
-        
-        self.walls.extend([top_wall, bottom_wall])
+        self.walls.append(self.make_wall(self.width, 0, wall_config['width'],
+                                         gap_y - wall_config['gap'] // 2, wall_speed))
+        self.walls.append(self.make_wall(self.width, gap_y + wall_config['gap'] // 2,
+                                         wall_config['width'],
+                                         self.height - (gap_y + wall_config['gap'] // 2),
+                                         wall_speed))
+
+    def make_wall(self, x: float, y: float, width: int, height: int, speed: float) -> Wall:
+        if self.wall_pool:
+            wall = self.wall_pool.pop()
+            wall.reset(x, y, width, height, speed)
+            return wall
+        return Wall(x, y, width, height, speed)
 
     def spawn_enemy(self):
-        level_data = self.config['levels'][self.current_level]
-        enemy_config = self.config['enemies']
+        enemy_config = self.enemy_config
         
-        y = random.randint(enemy_config['height'],
-                          self.height - enemy_config['height'])
-        enemy = Enemy(self.width, y, enemy_config,
-                     level_data['enemy_speed_multiplier'])
+        y = random_int(enemy_config['height'],
+                       self.height - enemy_config['height'])
+        enemy = self.make_enemy(self.width, y, enemy_config,
+                                self.level_data['enemy_speed_multiplier'])
         self.enemies.append(enemy)
 
+    def make_enemy(self, x: float, y: float, config: Dict, speed_multiplier: float) -> Enemy:
+        if self.enemy_pool:
+            enemy = self.enemy_pool.pop()
+            enemy.reset(x, y, config, speed_multiplier)
+            return enemy
+        return Enemy(x, y, config, speed_multiplier)
+
     def check_collisions(self) -> bool:
         # Check wall collisions
-        for wall in self.walls:
-            if self.player.rect.colliderect(wall.rect):
-                return True
+        if self.player.rect.collidelist([wall.rect for wall in self.walls]) != -1:
+            return True
 
         # Check enemy collisions
-        for enemy in self.enemies:
-            if self.player.rect.colliderect(enemy.rect):
-                self.sounds['enemy'].play()
-                return True
+        if self.player.rect.collidelist([enemy.rect for enemy in self.enemies]) != -1:
+            self.sounds['enemy'].play()
+            return True
 
         # Check screen boundaries
         if self.player.rect.top <= 0 or self.player.rect.bottom >= self.height:
@@ -281,102 +431,116 @@ class FlappyBird:
 
         return False
 
-    def update_game_objects(self):
+    def update_game_objects(self, current_time: int):
         # Update player
         self.player.update()
 
-        # Update and clean up walls
-        for wall in self.walls[:]:
+        # Update walls, keeping the ones still on screen
+        kept_walls = []
+        for wall in self.walls:
             wall.update()
             if wall.rect.right < 0:
-                self.walls.remove(wall)
+                self.wall_pool.append(wall)
                 self.score += 0.5  # 0.5 for each wall (top/bottom pair = 1 point)
+            else:
+                kept_walls.append(wall)
+        self.walls = kept_walls
 
-        # Update and clean up enemies
-        for enemy in self.enemies[:]:
-            enemy.update()
+        # Update enemies, keeping the ones still on screen
+        Enemy.update_all(self.enemies)
+        kept_enemies = []
+        for enemy in self.enemies:
             if enemy.rect.right < 0:
-                self.enemies.remove(enemy)
+                self.enemy_pool.append(enemy)
+            else:
+                kept_enemies.append(enemy)
+        self.enemies = kept_enemies
 
-        # Update and clean up projectiles
-        for projectile in self.projectiles[:]:
+        # Update projectiles, dropping those off screen or hitting an enemy
+        enemy_rects = [enemy.rect for enemy in self.enemies]
+        kept_projectiles = []
+        for projectile in self.projectiles:
             projectile.update()
-            # Remove projectiles that are off screen
             if projectile.rect.left > self.width:
-                self.projectiles.remove(projectile)
+                self.projectile_pool.append(projectile)
+                continue
+            hit = projectile.rect.collidelist(enemy_rects)
+            if hit == -1:
+                kept_projectiles.append(projectile)
             else:
-                # Check for collisions with enemies
-                for enemy in self.enemies[:]:
-                    if projectile.rect.colliderect(enemy.rect):
-                        self.enemies.remove(enemy)
-                        self.projectiles.remove(projectile)
-                        self.score += 2  # Bonus points for killing an enemy
-                        break
+                self.projectile_pool.append(projectile)
+                self.enemy_pool.append(self.enemies[hit])
+                # Order doesn't matter, so swap the hit enemy with the last one and pop
+                self.enemies[hit] = self.enemies[-1]
+                self.enemies.pop()
+                enemy_rects[hit] = enemy_rects[-1]
+                enemy_rects.pop()
+                self.score += 2  # Bonus points for killing an enemy
+        self.projectiles = kept_projectiles
 
         # Spawn new walls
-        level_data = self.config['levels'][self.current_level]
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_wall > level_data['wall_frequency']:
+        if current_time - self.last_wall > self.wall_frequency:
             self.create_wall_pair()
             self.last_wall = current_time
 
         # Spawn new enemies
-        if current_time - self.last_enemy > self.config['enemies']['spawn_rate']:
-            if len(self.enemies) < level_data['enemy_count']:
+        if current_time - self.last_enemy > self.enemy_spawn_rate:
+            if len(self.enemies) < self.enemy_count:
                 self.spawn_enemy()
                 self.last_enemy = current_time
 
     def draw_scrolling_background(self):
-        # Calculate how many background images we need to fill the screen
-        bg_width = self.background.get_width()
-        tiles = math.ceil(self.width / bg_width) + 2  # Add extra tile for smoother transition
+        bg_width = self._bg_width
         
-        # Calculate the first tile index based on scroll position
-        first_tile = math.floor(self.bg_scroll / bg_width)
+        # First tile index (0 or 1, as the scroll wraps every two tiles) and its offset
+        first_tile, offset = divmod(self.bg_scroll, bg_width)
         
-        # Draw the background tiles
-        for i in range(tiles):
-            current_tile = first_tile + i
-            x_pos = i * bg_width - (self.bg_scroll % bg_width)
-            
-            # Alternate between regular and flipped background
-            if current_tile % 2 == 0:
-                self.screen.blit(self.background, (x_pos, 0))
-            else:
-                self.screen.blit(self.background_flipped, (x_pos, 0))
+        # Draw the background tiles, alternating between regular and flipped
+        backgrounds = self._bg_images
+        for i in range(self._bg_tiles):
+            self.screen.blit(backgrounds[(first_tile + i) % 2], (i * bg_width - offset, 0))
         
-        # Update scroll position
+        # Update scroll position, wrapping after a regular + flipped pair to keep tile parity
         if self.game_state == "PLAYING":
-            self.bg_scroll = (self.bg_scroll + self.bg_scroll_speed)
+            self.bg_scroll += self.bg_scroll_speed
+            if self.bg_scroll >= 2 * bg_width:
+                self.bg_scroll -= 2 * bg_width
 
     def draw_game_objects(self):
         # Draw scrolling background
         self.draw_scrolling_background()
 
-        # Draw walls
+        # Draw walls, enemies and projectiles (in that order) in one batched blit
+        blit_list = []
         for wall in self.walls:
-            wall.draw(self.screen)
-
-        # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw(self.screen, self.enemy_img)
-
-        # Draw projectiles
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
+            wall_blits = wall.template_blits(self._wall_template)
+            if wall_blits is None:
+                wall.draw(self.screen)  # Fall back to drawing the column by hand
+            else:
+                blit_list.extend(wall_blits)
+        
+        enemy_img = self.enemy_img
+        blit_list.extend([(enemy_img, enemy.rect) for enemy in self.enemies])
+        
+        sprite = Projectile.get_sprite()
+        blit_list.extend([(sprite, projectile.rect) for projectile in self.projectiles])
+        
+        self.screen.blits(blit_list, False)
 
         # Draw player
         self.player.draw(self.screen, self.player_img)
 
-        # Draw score
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {int(self.score)}', True, (255, 255, 255))
-        high_score_text = font.render(f'High Score: {self.high_score}', True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(high_score_text, (10, 50))
-
-    def create_button(self, text, font_size, y_position):
-        font = pygame.font.Font(None, font_size)
+        # Draw score (re-rendered only when it changes)
+        hud_score = (int(self.score), self.high_score)
+        if hud_score != self._hud_score:
+            self._hud_score = hud_score
+            score_text = self.font_small.render(f'Score: {hud_score[0]}', True, (255, 255, 255))
+            high_score_text = self.font_small.render(f'High Score: {hud_score[1]}', True, (255, 255, 255))
+            self._hud_surfaces = [(score_text, (10, 10)), (high_score_text, (10, 50))]
+        for surface, pos in self._hud_surfaces:
+            self.screen.blit(surface, pos)
+
+    def create_button(self, text, font, y_position):
         text_surface = font.render(text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.width // 2, y_position))
         
@@ -390,46 +554,52 @@ class FlappyBird:
         
         return text_surface, text_rect, button_rect
 
-    def draw_start_screen(self):
-        self.draw_scrolling_background()
-        
-        # Draw title
-        font_large = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 36)
-        
-        title = font_large.render('Flappy Bird Adventure', True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
-        self.screen.blit(title, title_rect)
-        
-        # Create and draw start button
-        start_text, text_rect, button_rect = self.create_button("Start Game", 48, self.height // 2)
+    def render_button(self, button_rect: pygame.Rect) -> Tuple[pygame.Surface, pygame.Rect]:
+        # Thick lines at the corners spill a couple of pixels past the rect
+        margin = 2
+        surface = pygame.Surface((button_rect.width + 2 * margin,
+                                  button_rect.height + 2 * margin), pygame.SRCALPHA)
+        local_rect = pygame.Rect(margin, margin, button_rect.width, button_rect.height)
         
         # Draw button with Roman-style decoration
-        pygame.draw.rect(self.screen, (200, 180, 150), button_rect)  # Base color
-        pygame.draw.rect(self.screen, (180, 160, 130), button_rect, 3)  # Border
+        pygame.draw.rect(surface, (200, 180, 150), local_rect)  # Base color
+        pygame.draw.rect(surface, (180, 160, 130), local_rect, 3)  # Border
         
         # Add decorative corners
         corner_size = 10
-        for corner in [(button_rect.topleft, (1, 1)), 
-                      (button_rect.topright, (-1, 1)),
-                      (button_rect.bottomleft, (1, -1)), 
-                      (button_rect.bottomright, (-1, -1))]:
+        for corner in [(local_rect.topleft, (1, 1)), 
+                      (local_rect.topright, (-1, 1)),
+                      (local_rect.bottomleft, (1, -1)), 
+                      (local_rect.bottomright, (-1, -1))]:
             pos, direction = corner
-            pygame.draw.line(self.screen, (180, 160, 130),
+            pygame.draw.line(surface, (180, 160, 130),
                            (pos[0], pos[1]),
                            (pos[0] + corner_size * direction[0], pos[1]),
                            3)
-            pygame.draw.line(self.screen, (180, 160, 130),
+            pygame.draw.line(surface, (180, 160, 130),
                            (pos[0], pos[1]),
                            (pos[0], pos[1] + corner_size * direction[1]),
                            3)
         
-        self.screen.blit(start_text, text_rect)
+        return surface, button_rect.inflate(2 * margin, 2 * margin)
+
+    def build_text_surfaces(self):
+        # Static text only depends on the window size, so render it once
+        self._text_surfaces_size = (self.width, self.height)
+        
+        # Start screen: title, button and instructions
+        self._start_surfaces = []
+        title = self.font_large.render('Flappy Bird Adventure', True, (255, 255, 255))
+        title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
+        self._start_surfaces.append((title, title_rect))
+        
+        start_text, text_rect, button_rect = self.create_button("Start Game", self.font_medium, self.height // 2)
+        self._start_surfaces.append(self.render_button(button_rect))
+        self._start_surfaces.append((start_text, text_rect))
         
         # Store button rect for click detection
         self.start_button_rect = button_rect
         
-        # Draw instructions
         instructions = [
             "How to Play:",
             "• Press SPACE to flap and fly",
@@ -445,41 +615,83 @@ class FlappyBird:
                 # Make the header stand out with a different color and bold effect
                 header_color = (220, 20, 60)  # Crimson red - more visible
                 # Draw the text twice with slight offset for bold effect
-                text = font_medium.render(instruction, True, header_color)
+                text = self.font_small.render(instruction, True, header_color)
                 text_rect = text.get_rect(center=(self.width // 2, y_offset))
                 # Draw shadow/outline
                 shadow_offset = 2
-                shadow_text = font_medium.render(instruction, True, (0, 0, 0))  # Black shadow
+                shadow_text = self.font_small.render(instruction, True, (0, 0, 0))  # Black shadow
                 shadow_rect = text_rect.copy()
                 shadow_rect.x -= shadow_offset
                 shadow_rect.y -= shadow_offset
-                self.screen.blit(shadow_text, shadow_rect)
-                # Draw main text
-                self.screen.blit(text, text_rect)
+                self._start_surfaces.append((shadow_text, shadow_rect))
+                self._start_surfaces.append((text, text_rect))
             else:
                 # Instructions in bright white
-                text = font_medium.render(instruction, True, (255, 255, 255))
+                text = self.font_small.render(instruction, True, (255, 255, 255))
                 text_rect = text.get_rect(center=(self.width // 2, y_offset))
-                self.screen.blit(text, text_rect)
+                self._start_surfaces.append((text, text_rect))
             y_offset += 35  # Space between lines
+        
+        # Game over screen: everything except the score
+        game_over_text = self.font_large.render('Game Over', True, (255, 255, 255))
+        restart_text = self.font_large.render('Press SPACE to Restart', True, (255, 255, 255))
+        self._game_over_surfaces = [
+            (game_over_text, game_over_text.get_rect(center=(self.width // 2, self.height // 3))),
+            (restart_text, restart_text.get_rect(center=(self.width // 2, self.height // 2)))
+        ]
+        
+        # Score text is re-rendered only when the score changes
+        self._hud_score = None
+        self._hud_surfaces = []
+        self._game_over_score = None
+        self._game_over_score_surface = None
 
-    def draw_game_over_screen(self):
-        font = pygame.font.Font(None, 64)
-        game_over_text = font.render('Game Over', True, (255, 255, 255))
-        restart_text = font.render('Press SPACE to Restart', True, (255, 255, 255))
-        score_text = font.render(f'Score: {int(self.score)}', True, (255, 255, 255))
+    def draw_start_screen(self):
+        self.draw_scrolling_background()
         
-        game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 3))
-        restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2))
-        score_rect = score_text.get_rect(center=(self.width // 2, 2 * self.height // 3))
+        if self._text_surfaces_size != (self.width, self.height):
+            self.build_text_surfaces()
         
-        self.screen.blit(game_over_text, game_over_rect)
-        self.screen.blit(restart_text, restart_rect)
-        self.screen.blit(score_text, score_rect)
+        for surface, rect in self._start_surfaces:
+            self.screen.blit(surface, rect)
+
+    def draw_game_over_screen(self):
+        if self._text_surfaces_size != (self.width, self.height):
+            self.build_text_surfaces()
+        
+        for surface, rect in self._game_over_surfaces:
+            self.screen.blit(surface, rect)
+        
+        score = int(self.score)
+        if score != self._game_over_score:
+            self._game_over_score = score
+            score_text = self.font_large.render(f'Score: {score}', True, (255, 255, 255))
+            score_rect = score_text.get_rect(center=(self.width // 2, 2 * self.height // 3))
+            self._game_over_score_surface = (score_text, score_rect)
+        self.screen.blit(*self._game_over_score_surface)
+
+    def profile_autopilot(self, current_time: int):
+        # Aim for the middle of the next gap (walls come in top/bottom pairs)
+        target_y = self.height // 2
+        for i in range(0, len(self.walls) - 1, 2):
+            top_wall, bottom_wall = self.walls[i], self.walls[i + 1]
+            if top_wall.rect.right >= self.player.rect.left:
+                target_y = (top_wall.rect.bottom + bottom_wall.rect.top) // 2
+                break
+        
+        if self.player.rect.centery > target_y and self.player.velocity >= 0:
+            self.player.flap()
+        
+        # Keep firing so projectiles and enemy hits show up in the profile
+        self.shoot_projectile(current_time)
 
     def run(self):
         running = True
+        frames = 0
         while running:
+            # One timestamp per frame, shared by everything updated in it
+            current_time = pygame.time.get_ticks()
+            
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -489,13 +701,10 @@ class FlappyBird:
                             # Check if click is within button bounds
                             if self.start_button_rect.collidepoint(event.pos):
                                 self.game_state = "PLAYING"
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        if self.game_state == "START" and hasattr(self, 'start_button_rect'):
-                            if self.start_button_rect.collidepoint(event.pos):
-                                self.game_state = "PLAYING"
                         elif self.game_state == "PLAYING":
-                            self.shoot_projectile()
+                            self.shoot_projectile(current_time)
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.drawn_state = None  # Force the next frame to be redrawn
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         if self.game_state == "PLAYING":
@@ -505,28 +714,40 @@ class FlappyBird:
                             self.reset_game()
                             self.game_state = "PLAYING"
                     elif event.key == pygame.K_RIGHT and self.game_state == "PLAYING":
-                        self.shoot_projectile()
+                        self.shoot_projectile(current_time)
 
             if self.game_state == "PLAYING":
-                self.update_game_objects()
+                if self.profile_frames:
+                    self.profile_autopilot(current_time)
+                self.update_game_objects(current_time)
                 
-                if self.check_collisions():
+                # The player can't die while profiling, so objects build up to a steady state
+                if self.check_collisions() and not self.profile_frames:
                     self.sounds['gameover'].play()
                     if self.score > self.high_score:
                         self.high_score = int(self.score)
                         self.save_high_score()
                     self.game_state = "GAME_OVER"
 
-            # Draw current game state
-            if self.game_state == "START":
-                self.draw_start_screen()
-            elif self.game_state == "PLAYING":
-                self.draw_game_objects()
-            elif self.game_state == "GAME_OVER":
-                self.draw_game_over_screen()
+            # Draw current game state. The scrolling background changes every pixel
+            # while playing, but the menus only need drawing once when shown.
+            if self.game_state == "PLAYING" or self.game_state != self.drawn_state:
+                if self.game_state == "START":
+                    self.draw_start_screen()
+                elif self.game_state == "PLAYING":
+                    self.draw_game_objects()
+                elif self.game_state == "GAME_OVER":
+                    self.draw_game_over_screen()
+
+                pygame.display.flip()
+                self.drawn_state = self.game_state
 
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+            self.clock.tick(self.fps if self.game_state == "PLAYING" else self.menu_fps)
+
+            if self.game_state == "PLAYING":
+                frames += 1
+            if self.profile_frames and frames >= self.profile_frames:
+                running = False
 
         pygame.quit()
 